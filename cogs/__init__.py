@@ -0,0 +1 @@
+"""E-Okul botunun discord.py eklentileri (cog'lar)."""
@@ -0,0 +1,83 @@
+"""
+Öğrenci, ders ve not slash komutları
+------------------------------------
+``EOkulBot.setup_hook`` içinde ``load_extension("cogs.notlar")`` ile yüklenir.
+Komutlarda yapılan bir değişiklik, süreci yeniden başlatmadan
+``bot.reload_extension("cogs.notlar")`` ile devreye alınabilir. Veri işlemleri
+bot üzerindeki ``data_mgr`` (``DataManager``) nesnesi üzerinden yapılır.
+"""
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from main import DataManager, EOkulBot
+
+_OK_DERS = "✅ Ders eklendi."
+_DUP_DERS = "❗ Bu ders kodu zaten mevcut!"
+_OK_OGRENCI = "✅ Öğrenci eklendi."
+_DUP_OGRENCI = "❗ Bu numara zaten kayıtlı!"
+
+class Notlar(commands.Cog):
+    def __init__(self, bot: EOkulBot):
+        self.bot = bot
+
+    @property
+    def data_mgr(self) -> DataManager:
+        # Eklenti, setup_hook veriyi yükledikten sonra yüklendiği için burada None olamaz.
+        assert self.bot.data_mgr is not None
+        return self.bot.data_mgr
+
+    @app_commands.command(name="ders_ekle", description="Yeni ders ekle")
+    @app_commands.describe(kod="Ders kodu (örn: MAT101)", ad="Ders adı", kredi="Kredi (varsayılan 1)")
+    async def ders_ekle(self, inter: discord.Interaction, kod: str, ad: str, kredi: int = 1):
+        eklendi = self.data_mgr.ders_ekle(kod, ad, kredi)
+        await inter.response.send_message(_OK_DERS if eklendi else _DUP_DERS, ephemeral=True)
+
+    @app_commands.command(name="ogrenci_ekle", description="Yeni öğrenci ekle")
+    @app_commands.describe(no="Öğrenci numarası", ad="Ad Soyad", sinif="Sınıf (örn: 10-A)")
+    async def ogrenci_ekle(self, inter: discord.Interaction, no: str, ad: str, sinif: str):
+        eklendi = self.data_mgr.ogrenci_ekle(no, ad, sinif)
+        await inter.response.send_message(_OK_OGRENCI if eklendi else _DUP_OGRENCI, ephemeral=True)
+
+    @app_commands.command(name="not_gir", description="Not gir / güncelle")
+    @app_commands.describe(
+        no="Öğrenci numarası",
+        ders_kodu="Ders kodu (örn: MAT101)",
+        sinav1="Sınav 1 (boş bırakılırsa değişmez)",
+        sinav2="Sınav 2 (boş bırakılırsa değişmez)",
+        proje="Proje (boş bırakılırsa değişmez)",
+    )
+    async def not_gir(
+        self,
+        inter: discord.Interaction,
+        no: str,
+        ders_kodu: str,
+        sinav1: Optional[float] = None,
+        sinav2: Optional[float] = None,
+        proje: Optional[float] = None,
+    ):
+        sonuc = self.data_mgr.not_gir(no, ders_kodu, sinav1, sinav2, proje)
+        await inter.response.send_message(sonuc, ephemeral=True)
+
+    @app_commands.command(name="karne", description="Öğrencinin karnesini göster")
+    @app_commands.describe(no="Öğrenci numarası")
+    async def karne(self, inter: discord.Interaction, no: str):
+        rapor = self.data_mgr.karne(no)
+        if rapor is None:
+            await inter.response.send_message("❗ Öğrenci bulunamadı.", ephemeral=True)
+        elif len(rapor) > 1800:
+            # Uzun raporlar mesaj sınırını aşabileceği için metin dosyası olarak ekleniyor.
+            dosya = discord.File(io.BytesIO(rapor.encode("utf-8")), filename="karne.txt")
+            await inter.response.send_message(file=dosya, ephemeral=False)
+        else:
+            embed = discord.Embed(description=f"```\n{rapor}\n```")
+            await inter.response.send_message(embed=embed, ephemeral=False)
+
+async def setup(bot: EOkulBot):
+    await bot.add_cog(Notlar(bot))
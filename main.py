@@ -11,6 +11,8 @@ Gereksinimler
 ~~~~~~~~~~~~~
 • Python 3.10+
 • discord.py 2.3+  →  ``pip install -U discord.py``
+• İsteğe bağlı: orjson, ijson  →  ``pip install orjson ijson`` (büyük ``veri.json``
+  dosyalarında daha hızlı okuma/yazma)
 
 Kurulum
 ~~~~~~~~
@@ -20,26 +22,47 @@ Kurulum
 3. Gerekli kütüphaneleri kurun ve ``python e_okul_not_bot_2025.py`` komutunu
    çalıştırın.
 
+Veri Depolama
+~~~~~~~~~~~~~
+Veriler CLI sürümüyle ortak kullanılan ``veri.json`` dosyasında tutulur. Komutlar
+değişiklikleri yalnızca bellekte işaretler; dosya en fazla ``FLUSH_INTERVAL``
+saniyede bir, geçici dosyaya yazılıp ``os.replace`` ile yer değiştirilerek
+güncellenir.
+
 Slash Komutları
 ~~~~~~~~~~~~~~~
 • ``/ders_ekle kod ad kredi`` — Yeni ders ekler.
 • ``/ogrenci_ekle no ad sinif`` — Yeni öğrenci ekler.
-• ``/not_gir no ders_kodu sinav1 sinav2 proje`` — Not girer/günceller (boş bırakmak
-  için -1 kullanın).
+• ``/not_gir no ders_kodu [sinav1] [sinav2] [proje]`` — Not girer/günceller (boş
+  bırakılan notlar değişmez).
 • ``/karne no`` — Öğrencinin karnesini görüntüler.
 
 Not → Discord slash komut adlarında Türkçe karakter kullanılamadığından komut
 isimleri ASCII tutulmuştur.
+
+Komutlar ``cogs/notlar.py`` eklentisinde tanımlıdır ve bot başlarken yüklenir.
 """
-import discord
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import mmap
 import os
-from dataclasses import dataclass, asdict, field
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
-from statistics import mean
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson yoksa standart json modülüne düşülür
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson yoksa büyük dosyalar da tek seferde okunur
+    ijson = None
 
 import discord
 from discord import app_commands
@@ -49,13 +72,23 @@ from discord.ext import commands
 # Veri Modelleri (CLI sürümünden aynen alındı)
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Harf notu eşikleri: _LETTERS[bisect_right(_THRESH, ort)] ile aranır
+# (ör. 90 → "AA", 89.9 → "BA", 40'ın altı → "FF").
+_THRESH = (40, 50, 60, 70, 80, 85, 90)
+_LETTERS = ("FF", "DD", "DC", "CC", "CB", "BB", "BA", "AA")
+
+def _ortalama(puanlar: Iterable[Optional[float]]) -> Optional[float]:
+    """Boş (None) olmayan puanların ortalaması; hiç puan yoksa None."""
+    degerler = [p for p in puanlar if p is not None]
+    return sum(degerler) / len(degerler) if degerler else None
+
+@dataclass(slots=True)
 class Ders:
     kod: str
     ad: str
     kredi: int = 1
 
-@dataclass
+@dataclass(slots=True)
 class NotKaydi:
     ders_kodu: str
     sinav1: Optional[float] = None
@@ -63,31 +96,13 @@ class NotKaydi:
     proje: Optional[float] = None
 
     def ortalama(self) -> Optional[float]:
-        puanlar = [p for p in (self.sinav1, self.sinav2, self.proje) if p is not None]
-        return mean(puanlar) if puanlar else None
+        return _ortalama((self.sinav1, self.sinav2, self.proje))
 
     def harf_notu(self) -> Optional[str]:
         ort = self.ortalama()
-        if ort is None:
-            return None
-        if ort >= 90:
-            return "AA"
-        elif ort >= 85:
-            return "BA"
-        elif ort >= 80:
-            return "BB"
-        elif ort >= 70:
-            return "CB"
-        elif ort >= 60:
-            return "CC"
-        elif ort >= 50:
-            return "DC"
-        elif ort >= 40:
-            return "DD"
-        else:
-            return "FF"
-
-@dataclass
+        return None if ort is None else _LETTERS[bisect_right(_THRESH, ort)]
+
+@dataclass(slots=True)
 class Ogrenci:
     no: str
     ad: str
@@ -95,18 +110,28 @@ class Ogrenci:
     notlar: Dict[str, NotKaydi] = field(default_factory=dict)
 
     def genel_ortalama(self) -> Optional[float]:
-        ortalamalar = [nk.ortalama() for nk in self.notlar.values() if nk.ortalama() is not None]
-        return mean(ortalamalar) if ortalamalar else None
+        return _ortalama(nk.ortalama() for nk in self.notlar.values())
 
 # ---------------------------------------------------------------------------
 # Veri Yönetimi
 # ---------------------------------------------------------------------------
 
 DATA_FILE = Path("veri.json")
+FLUSH_INTERVAL = 2  # saniye; değişiklikler en fazla bu aralıkla diske yazılır
+STREAM_THRESHOLD = 10 * 1024 * 1024  # bayt; orjson yoksa bundan büyük veri.json ijson ile okunur
+
+_KARNE_AYRAC = "-" * 41
+_KARNE_BASLIK = f"{'Ders':<10} {'S1':>5} {'S2':>5} {'PR':>5} {'Ort':>6} {'Harf':>5}"
 
 class DataManager:
     def __init__(self):
         self.data = self._load()
+        self._dirty = False
+        self._flush_lock = asyncio.Lock()
+        # İş parçacığında süren son yazma; flush iptal edilse bile çalışmaya devam eder.
+        self._pending_write: Optional[asyncio.Future] = None
+        # Öğrenci no → hazırlanmış karne metni; not girişinde geçersiz kılınır.
+        self._karne_cache: Dict[str, str] = {}
 
     # ---------------------- IO ---------------------- #
     def _default(self) -> dict:
@@ -114,150 +139,219 @@ class DataManager:
 
     def _load(self) -> dict:
         if DATA_FILE.exists():
+            if orjson is not None:
+                return self._load_mmap()
+            if ijson is not None and DATA_FILE.stat().st_size > STREAM_THRESHOLD:
+                return self._load_stream()
             with DATA_FILE.open("r", encoding="utf-8") as f:
                 return json.load(f)
         return self._default()
 
-    def _save(self):
-        with DATA_FILE.open("w", encoding="utf-8") as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+    def _load_mmap(self) -> dict:
+        # Dosya belleğe eşlenip baytları ara kopya olmadan orjson'a verilir.
+        with DATA_FILE.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as mv:
+                return orjson.loads(mv)
+
+    def _load_stream(self) -> dict:
+        # Dosyayı tek seferde bir metne okuyup çözmek yerine tepe düzey anahtarları
+        # tek geçişte sırayla okur; CLI'nın eklediği başka anahtarlar da korunur.
+        with DATA_FILE.open("rb") as f:
+            return dict(ijson.kvitems(f, "", use_float=True))
+
+    def _encode(self) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _write(self, payload: bytes):
+        # Önce geçici dosyaya yazıp os.replace ile yer değiştiriyoruz; yazma
+        # yarıda kesilse bile veri.json bozulmaz.
+        tmp = DATA_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, DATA_FILE)
+
+    async def flush(self):
+        """Bekleyen değişiklikleri olay döngüsünü bloklamadan diske yazar."""
+        async with self._flush_lock:
+            if self._pending_write is not None:
+                # Önceki flush iptal edilmiş olabilir ama başlattığı yazma hâlâ
+                # sürüyor olabilir; aynı geçici dosyaya iki yazıcı düşmesin.
+                await asyncio.wait([self._pending_write])
+                self._pending_write = None
+            if not self._dirty:
+                return
+            # Serileştirme olay döngüsünde yapılır ki komutlar veriyi yazma
+            # sırasında değiştiremesin; yalnızca disk işlemi iş parçacığına gider.
+            payload = self._encode()
+            self._dirty = False
+            self._pending_write = asyncio.get_running_loop().run_in_executor(None, self._write, payload)
+            try:
+                await asyncio.shield(self._pending_write)
+            except BaseException:
+                self._dirty = True
+                raise
+            self._pending_write = None
+
+    async def flush_loop(self):
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                print("🔴 Veri kaydetme hatası:", e)
 
     # ---------------------- Ders --------------------- #
     def ders_ekle(self, kod: str, ad: str, kredi: int = 1) -> bool:
         kod = kod.upper()
         if kod in self.data["dersler"]:
             return False
-        self.data["dersler"][kod] = asdict(Ders(kod, ad, kredi))
-        self._save()
+        self.data["dersler"][kod] = {"kod": kod, "ad": ad, "kredi": kredi}
+        self._dirty = True
         return True
 
     # -------------------- Öğrenci -------------------- #
     def ogrenci_ekle(self, no: str, ad: str, sinif: str) -> bool:
         if no in self.data["ogrenciler"]:
             return False
-        self.data["ogrenciler"][no] = asdict(Ogrenci(no, ad, sinif))
-        self._save()
+        self.data["ogrenciler"][no] = {"no": no, "ad": ad, "sinif": sinif, "notlar": {}}
+        self._karne_cache.pop(no, None)
+        self._dirty = True
         return True
 
     # ---------------------- Not ---------------------- #
     def not_gir(self, no: str, ders_kodu: str, s1: float | None, s2: float | None, prj: float | None) -> str:
         if no not in self.data["ogrenciler"]:
             return "Öğrenci bulunamadı."
-        if ders_kodu.upper() not in self.data["dersler"]:
+        kod = ders_kodu.upper()
+        if kod not in self.data["dersler"]:
             return "Ders bulunamadı."
-        ogr = self.data["ogrenciler"][no]
-        nk = ogr["notlar"].get(ders_kodu.upper(), {})
+        ogr_notlar = self.data["ogrenciler"][no]["notlar"]
+        nk = ogr_notlar.get(kod, {})
         if s1 is not None:
             nk["sinav1"] = s1
         if s2 is not None:
             nk["sinav2"] = s2
         if prj is not None:
             nk["proje"] = prj
-        ogr["notlar"][ders_kodu.upper()] = nk
-        self._save()
+        ogr_notlar[kod] = nk
+        self._karne_cache.pop(no, None)
+        self._dirty = True
         return "Notlar güncellendi."
 
     # ------------------- Karne ----------------------- #
     def karne(self, no: str) -> Optional[str]:
-        if no not in self.data["ogrenciler"]:
+        rapor = self._karne_cache.get(no)
+        if rapor is not None:
+            return rapor
+        # Kayıtlar doğrudan sözlük üzerinden okunur; her not için
+        # Ogrenci/NotKaydi nesnesi kurmaya gerek yok.
+        ogr = self.data["ogrenciler"].get(no)
+        if ogr is None:
             return None
-        ogr = Ogrenci(**self.data["ogrenciler"][no])
-        satirlar = [
-            f"Öğrenci: {ogr.ad} ({ogr.no})  Sınıf: {ogr.sinif}",
-            "-----------------------------------------",
-            f"{'Ders':<10} {'S1':>5} {'S2':>5} {'PR':>5} {'Ort':>6} {'Harf':>5}",
-        ]
-        for ders_kodu, nk_dict in ogr.notlar.items():
-            nk = NotKaydi(**nk_dict)
-            satirlar.append(
-                f"{ders_kodu:<10} {nk.sinav1 or '-':>5} {nk.sinav2 or '-':>5} "
-                f"{nk.proje or '-':>5} {nk.ortalama() or '-':>6} {nk.harf_notu() or '-':>5}"
-            )
-        satirlar.append("-----------------------------------------")
-        genel = ogr.genel_ortalama()
-        satirlar.append(f"Genel Ortalama: {genel:.2f}" if genel else "Genel Ortalama: -")
-        return "\n".join(satirlar)
+        ortalamalar: List[Optional[float]] = []
+
+        def satirlar():
+            # Her satır başındaki "\n" ile yazılır; not yoksa gövde boş kalır.
+            for ders_kodu, nk in ogr["notlar"].items():
+                s1, s2, prj = nk.get("sinav1"), nk.get("sinav2"), nk.get("proje")
+                ort = _ortalama((s1, s2, prj))
+                ortalamalar.append(ort)
+                harf = "-" if ort is None else _LETTERS[bisect_right(_THRESH, ort)]
+                yield (
+                    f"\n{ders_kodu.ljust(10)} {str(s1 or '-').rjust(5)} {str(s2 or '-').rjust(5)} "
+                    f"{str(prj or '-').rjust(5)} {str(ort or '-').rjust(6)} {harf.rjust(5)}"
+                )
+
+        govde = "".join(satirlar())
+        genel = _ortalama(ortalamalar)
+        rapor = self._karne_cache[no] = (
+            f"Öğrenci: {ogr['ad']} ({ogr['no']})  Sınıf: {ogr['sinif']}\n"
+            f"{_KARNE_AYRAC}\n{_KARNE_BASLIK}{govde}\n{_KARNE_AYRAC}\n"
+            f"Genel Ortalama: {f'{genel:.2f}' if genel else '-'}"
+        )
+        return rapor
 
 # ---------------------------------------------------------------------------
 # Discord Bot Tanımı
 # ---------------------------------------------------------------------------
 
-data_mgr = DataManager()
+# Son senkronize edilen komut kümesinin imzası; değişmediyse tree.sync() atlanır.
+CMD_SIG_FILE = Path(".cmd_sig")
+
+def _komut_imzasi(app_id: Optional[int], tree: app_commands.CommandTree) -> str:
+    komutlar = sorted(
+        (
+            c.name,
+            c.description,
+            [(p.name, p.description, str(p.type), p.required) for p in c.parameters],
+        )
+        for c in tree.get_commands()
+    )
+    return hashlib.blake2b(json.dumps([app_id, komutlar]).encode("utf-8")).hexdigest()
 
 class EOkulBot(commands.Bot):
     def __init__(self):
-        intents = discord.Intents.default()
+        # Bot yalnızca slash komutlarıyla çalışır; mesaj, üye, tepki vb. olaylara
+        # abone olmaya gerek yok. guilds, discord.py'nin sunucu/kanal önbelleği
+        # için açık bırakılıyor.
+        intents = discord.Intents.none()
+        intents.guilds = True
         super().__init__(command_prefix="/", intents=intents)
-
-    async def on_ready(self):
-        print(f"✅ Bot giriş yaptı: {self.user} (ID: {self.user.id})")
+        # Veri, bot başlarken setup_hook içinde ayrı bir iş parçacığında yüklenir.
+        self.data_mgr: Optional[DataManager] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def setup_hook(self):
+        self.data_mgr = await asyncio.get_running_loop().run_in_executor(None, DataManager)
+        self._flush_task = asyncio.create_task(self.data_mgr.flush_loop())
+        await self.load_extension("cogs.notlar")
+        await self._komutlari_senkronize_et()
+
+    async def _komutlari_senkronize_et(self):
+        # setup_hook yalnızca bir kez çalışır; on_ready ise her yeniden
+        # bağlantıda tetiklendiğinden senkronizasyon buraya alındı.
+        imza = _komut_imzasi(self.application_id, self.tree)
+        try:
+            if CMD_SIG_FILE.read_text(encoding="utf-8") == imza:
+                print("🌐 Komutlar güncel, senkronizasyon atlandı.")
+                return
+        except (OSError, ValueError):  # dosya yok/okunamıyor ya da bozuk
+            pass
         try:
             synced = await self.tree.sync()
             print(f"🌐 {len(synced)} komut senkronize edildi.")
         except Exception as e:
             print("🔴 Komut senkronizasyon hatası:", e)
+            return
+        CMD_SIG_FILE.write_text(imza, encoding="utf-8")
 
-bot = EOkulBot()
+    async def close(self):
+        try:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                await asyncio.gather(self._flush_task, return_exceptions=True)
+            if self.data_mgr is not None:
+                await self.data_mgr.flush()
+        finally:
+            await super().close()
+
+    async def on_ready(self):
+        print(f"✅ Bot giriş yaptı: {self.user} (ID: {self.user.id})")
 
-# ----------------------- Slash Komutları ----------------------- #
-
-@bot.tree.command(name="ders_ekle", description="Yeni ders ekle")
-@app_commands.describe(kod="Ders kodu (örn: MAT101)", ad="Ders adı", kredi="Kredi (varsayılan 1)")
-async def ders_ekle(inter: discord.Interaction, kod: str, ad: str, kredi: int = 1):
-    if data_mgr.ders_ekle(kod, ad, kredi):
-        await inter.response.send_message("✅ Ders eklendi.", ephemeral=True)
-    else:
-        await inter.response.send_message("❗ Bu ders kodu zaten mevcut!", ephemeral=True)
-
-@bot.tree.command(name="ogrenci_ekle", description="Yeni öğrenci ekle")
-@app_commands.describe(no="Öğrenci numarası", ad="Ad Soyad", sinif="Sınıf (örn: 10-A)")
-async def ogrenci_ekle(inter: discord.Interaction, no: str, ad: str, sinif: str):
-    if data_mgr.ogrenci_ekle(no, ad, sinif):
-        await inter.response.send_message("✅ Öğrenci eklendi.", ephemeral=True)
-    else:
-        await inter.response.send_message("❗ Bu numara zaten kayıtlı!", ephemeral=True)
-
-@bot.tree.command(name="not_gir", description="Not gir / güncelle")
-@app_commands.describe(
-    no="Öğrenci numarası",
-    ders_kodu="Ders kodu (örn: MAT101)",
-    sinav1="Sınav 1 (boş için -1)",
-    sinav2="Sınav 2 (boş için -1)",
-    proje="Proje (boş için -1)",
-)
-async def not_gir(
-    inter: discord.Interaction,
-    no: str,
-    ders_kodu: str,
-    sinav1: float,
-    sinav2: float,
-    proje: float,
-):
-    s1 = None if sinav1 == -1 else sinav1
-    s2 = None if sinav2 == -1 else sinav2
-    pr = None if proje == -1 else proje
-    sonuc = data_mgr.not_gir(no, ders_kodu, s1, s2, pr)
-    await inter.response.send_message(sonuc, ephemeral=True)
-
-@bot.tree.command(name="karne", description="Öğrencinin karnesini göster")
-@app_commands.describe(no="Öğrenci numarası")
-async def karne(inter: discord.Interaction, no: str):
-    rapor = data_mgr.karne(no)
-    if rapor is None:
-        await inter.response.send_message("❗ Öğrenci bulunamadı.", ephemeral=True)
-    else:
-        # Discord mesaj uzunluğu sınırlı, bu nedenle raporu ````` bloğu içinde gönderiyoruz.
-        await inter.response.send_message(f"```\n{rapor}\n```", ephemeral=False)
+bot = EOkulBot()
 
 # ---------------------------------------------------------------------------
 # Çalıştır
 # ---------------------------------------------------------------------------
 
+TOKEN = ""  # DISCORD_TOKEN ortam değişkeni tanımlı değilse kullanılır
+
 def main():
-    token = os.getenv("")
-    if token == "" or not token:
+    token = os.getenv("DISCORD_TOKEN") or TOKEN
+    if not token:
         raise RuntimeError("Bot token'ınızı kodun sonundaki TOKEN değişkenine veya DISCORD_TOKEN ortam değişkenine ekleyin!")
-    bot.run()
+    bot.run(token)
 
 if __name__ == "__main__":
-    main("bot.token")
\ No newline at end of file
+    main()
\ No newline at end of file